@@ -301,7 +301,11 @@ class ComfyClient(Client):
             pass
 
     async def _run_job(self, job: JobInfo):
-        workflow = create_workflow(job.work, self.models)
+        if settings.multi_threading:  # encoding input images can block the UI for a while
+            loop = asyncio.get_running_loop()
+            workflow = await loop.run_in_executor(None, create_workflow, job.work, self.models)
+        else:
+            workflow = create_workflow(job.work, self.models)
         if settings.debug_dump_workflow:
             workflow.embed_images().dump(util.log_dir)
 
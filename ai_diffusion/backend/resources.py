@@ -330,21 +330,11 @@ class ControlMode(Enum):
 
     @property
     def is_lines(self):
-        return self in [
-            ControlMode.scribble,
-            ControlMode.line_art,
-            ControlMode.soft_edge,
-            ControlMode.canny_edge,
-        ]
+        return self in _line_modes
 
     @property
     def has_preprocessor(self):
-        return self.is_control_net and self not in [
-            ControlMode.inpaint,
-            ControlMode.blur,
-            ControlMode.stencil,
-            ControlMode.universal,
-        ]
+        return self.is_control_net and self not in _no_preprocessor_modes
 
     @property
     def is_control_net(self):
@@ -352,20 +342,15 @@ class ControlMode(Enum):
 
     @property
     def is_ip_adapter(self):
-        return self in [
-            ControlMode.reference,
-            ControlMode.face,
-            ControlMode.style,
-            ControlMode.composition,
-        ]
+        return self in _ip_adapter_modes
 
     @property
     def is_internal(self):  # don't show in control layer mode dropdown
-        return self in [ControlMode.inpaint, ControlMode.universal]
+        return self in _internal_modes
 
     @property
     def is_part_of_image(self):  # not only used as guidance hint
-        return self in [ControlMode.reference, ControlMode.line_art, ControlMode.blur]
+        return self in _part_of_image_modes
 
     @property
     def is_structural(self):  # strong impact on image composition/structure
@@ -434,6 +419,20 @@ class ControlMode(Enum):
         return False
 
 
+# Mode sets used by ControlMode predicates, created once instead of on every call
+_line_modes = frozenset(
+    (ControlMode.scribble, ControlMode.line_art, ControlMode.soft_edge, ControlMode.canny_edge)
+)
+_ip_adapter_modes = frozenset(
+    (ControlMode.reference, ControlMode.face, ControlMode.style, ControlMode.composition)
+)
+_no_preprocessor_modes = frozenset(
+    (ControlMode.inpaint, ControlMode.blur, ControlMode.stencil, ControlMode.universal)
+)
+_internal_modes = frozenset((ControlMode.inpaint, ControlMode.universal))
+_part_of_image_modes = frozenset((ControlMode.reference, ControlMode.line_art, ControlMode.blur))
+
+
 def resource_id(kind: ResourceKind, arch: Arch, identifier: ControlMode | UpscalerName | str):
     if isinstance(identifier, Enum):
         identifier = identifier.name
@@ -280,6 +280,8 @@ class Bounds(NamedTuple):
 
     def relative_to(self, reference: Bounds):
         """Return bounds relative to another bounds."""
+        if reference.x == 0 and reference.y == 0:
+            return self
         return Bounds(self.x - reference.x, self.y - reference.y, self.width, self.height)
 
     @staticmethod
@@ -114,8 +114,11 @@ class ControlLayer(QObject, ObservableProperties):
         self._index = index
         self._update_is_supported()
 
-    def to_api(self, bounds: Bounds | None = None, time: int | None = None):
-        layer = self.layer
+    def to_api(
+        self, bounds: Bounds | None = None, time: int | None = None, layer: Layer | None = None
+    ):
+        if layer is None:
+            layer = self.layer
         if not self.is_supported:
             raise PluginError(f"Can't use '{layer.name}' as control layer: {self.error_text}")
 
@@ -250,16 +253,23 @@ class ControlLayerList(QObject):
         return self[-1]
 
     def remove(self, control: ControlLayer):
-        self._layers.remove(control)
+        index = control.index
+        if index >= len(self._layers) or self._layers[index] is not control:
+            index = self._layers.index(control)  # raises ValueError if not in the list
+        del self._layers[index]
         self.removed.emit(control)
 
-        for i, c in enumerate(self._layers):
-            c.index = i
+        for i in range(index, len(self._layers)):
+            self._layers[i].index = i
 
     def to_api(self, bounds: Bounds | None = None, time: int | None = None):
         for layer in (c for c in self._layers if not c.is_supported):
             log.warning(f"Trying to use control layer {layer.mode.name}: {layer.error_text}")
-        return [c.to_api(bounds, time) for c in self._layers if c.is_supported]
+        # Update the layer tree once for all control layers instead of once per layer
+        layers = self._model.layers.updated()
+        return [
+            c.to_api(bounds, time, layers.find(c.layer_id)) for c in self._layers if c.is_supported
+        ]
 
     def _update_last_mode(self, mode: ControlMode):
         self._last_mode = mode
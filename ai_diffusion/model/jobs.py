@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import Counter, deque
 from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum, Flag
@@ -117,23 +117,68 @@ class JobParams:
         return self.metadata.get("strength", 1.0)
 
 
+_no_results = ImageCollection()  # shared by jobs without results, must not be modified
+
+
 class Job:
-    id: str | None
+    __slots__ = (
+        "_id",
+        "_state",
+        "_queue",
+        "_size_mb",
+        "kind",
+        "params",
+        "control",
+        "timestamp",
+        "_results",
+        "in_use",
+    )
+
     kind: JobKind
-    state = JobState.queued
     params: JobParams
-    control: control.ControlLayer | None = None
+    control: control.ControlLayer | None
     timestamp: datetime
-    results: ImageCollection
     in_use: dict[int, bool]
 
     def __init__(self, id: str | None, kind: JobKind, params: JobParams):
-        self.id = id
+        self._id = id
+        self._state = JobState.queued
+        self._queue: JobQueue | None = None
         self.kind = kind
         self.params = params
+        self.control = None
         self.timestamp = datetime.now(timezone.utc)
-        self.results = ImageCollection()
+        self._results: ImageCollection | None = None
         self.in_use = {}
+        self._size_mb = 0.0  # memory of results accounted for in JobQueue
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, value: str | None):
+        if self._queue is not None:
+            self._queue._update_id(self, value)
+        self._id = value
+
+    @property
+    def state(self):
+        return self._state
+
+    @state.setter
+    def state(self, value: JobState):
+        if self._queue is not None:
+            self._queue._update_state(self, value)
+        self._state = value
+
+    @property
+    def results(self):
+        return self._results if self._results is not None else _no_results
+
+    @results.setter
+    def results(self, value: ImageCollection):
+        self._results = value
 
     def result_was_used(self, index: int):
         return self.in_use.get(index, False)
@@ -156,6 +201,8 @@ class JobQueue(QObject):
     def __init__(self):
         super().__init__()
         self._entries: deque[Job] = deque()
+        self._by_id: dict[str, Job] = {}
+        self._state_counts: Counter[JobState] = Counter()
         self._selection: list[JobQueue.Item] = []
         self._previous_selection: JobQueue.Item | None = None
         self._memory_usage = 0  # in MB
@@ -169,21 +216,27 @@ class JobQueue(QObject):
         return self.add_job(job)
 
     def add_job(self, job: Job):
+        if len(self._entries) >= settings.history_max_jobs:
+            self._discard_oldest_done()
         self._entries.append(job)
+        job._queue = self
+        if job.id is not None:
+            self._by_id[job.id] = job
+        self._state_counts[job.state] += 1
         self.count_changed.emit()
         return job
 
     def remove(self, job: Job):
         # Diffusion/Animation jobs: kept for history, pruned according to meomry usage
         # Other jobs: removed immediately once finished
-        self._entries.remove(job)
+        self._remove_entry(job)
         self.count_changed.emit()
 
     def find(self, id: str):
-        return next((j for j in self._entries if j.id == id), None)
+        return self._by_id.get(id)
 
     def count(self, state: JobState):
-        return sum(1 for j in self._entries if j.state is state)
+        return self._state_counts[state]
 
     def has_item(self, item: Item):
         job = self.find(item.job)
@@ -192,7 +245,8 @@ class JobQueue(QObject):
     def set_results(self, job: Job, results: ImageCollection):
         job.results = results
         if job.kind in [JobKind.diffusion, JobKind.animation]:
-            self._memory_usage += results.size / (1024**2)
+            job._size_mb = results.size / (1024**2)
+            self._memory_usage += job._size_mb
             self.prune(keep=job)
 
     def notify_started(self, job: Job):
@@ -229,14 +283,43 @@ class JobQueue(QObject):
         elif self._previous_selection is not None and self.has_item(self._previous_selection):
             self.selection = [self._previous_selection]
 
-    def _discard_job(self, job: Job):
+    def _remove_entry(self, job: Job):
         self._entries.remove(job)
-        self._memory_usage -= job.results.size / (1024**2)
+        job._queue = None
+        if job.id is not None and self._by_id.get(job.id) is job:
+            del self._by_id[job.id]
+        self._state_counts[job.state] -= 1
+
+    def _update_id(self, job: Job, id: str | None):
+        if job.id is not None and self._by_id.get(job.id) is job:
+            del self._by_id[job.id]
+        if id is not None:
+            self._by_id[id] = job
+
+    def _update_state(self, job: Job, state: JobState):
+        self._state_counts[job.state] -= 1
+        self._state_counts[state] += 1
+
+    def _discard_oldest_done(self):
+        # Queued and executing jobs are kept even if that exceeds the limit, they are still
+        # running on the server and must remain available for its messages and cancellation.
+        counts = self._state_counts
+        if counts[JobState.finished] + counts[JobState.cancelled] == 0:
+            return
+        done = (JobState.finished, JobState.cancelled)
+        if oldest := next((j for j in self._entries if j.state in done), None):
+            self._discard_job(oldest)
+
+    def _discard_job(self, job: Job):
+        self._remove_entry(job)
+        self._memory_usage -= job._size_mb
         self.job_discarded.emit(job)
 
     def prune(self, keep: Job):
-        while self._memory_usage > settings.history_size and self._entries[0] != keep:
-            self._discard_job(self._entries[0])
+        entries = self._entries
+        threshold = settings.history_size
+        while self._memory_usage > threshold and (oldest := entries[0]) is not keep:
+            self._discard_job(oldest)
 
     def discard(self, job_id: str, index: int):
         job = ensure(self.find(job_id))
@@ -246,7 +329,9 @@ class JobQueue(QObject):
         for i in range(index, len(job.results) - 1):
             job.in_use[i] = job.in_use.get(i + 1, False)
         img = job.results.remove(index)
-        self._memory_usage -= img.size / (1024**2)
+        img_size_mb = img.size / (1024**2)
+        job._size_mb -= img_size_mb
+        self._memory_usage -= img_size_mb
         self.result_discarded.emit(self.Item(job_id, index))
 
     def clear(self):
@@ -259,7 +344,7 @@ class JobQueue(QObject):
             self._discard_job(job)
 
     def any_executing(self):
-        return any(j.state is JobState.executing for j in self._entries)
+        return self._state_counts[JobState.executing] > 0
 
     def __len__(self):
         return len(self._entries)
@@ -5,6 +5,7 @@ import time
 import uuid
 import weakref
 from collections import deque
+from collections.abc import Callable
 from copy import copy
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
@@ -13,7 +14,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, NamedTuple
 
-from PyQt5.QtCore import QMetaObject, QObject, Qt, QUuid, pyqtSignal
+from PyQt5.QtCore import QMetaObject, QObject, Qt, QTimer, QUuid, pyqtSignal
 from PyQt5.QtGui import QBrush, QColor, QPainter
 
 from .. import eventloop, util
@@ -178,6 +179,21 @@ class DocumentModel(QObject, ObservableProperties):
         self.animation = AnimationWorkspace(self)
         self.custom = CustomWorkspace(workflows, self._generate_custom, self.jobs)
         self._style_connection: QMetaObject.Connection | None = None
+        self._pending_progress: float | None = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)  # limit progress updates to ~30 per second
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._message_handlers: dict[ClientEvent, Callable[[Job, ClientMessage], None]] = {
+            ClientEvent.queued: self._handle_queued,
+            ClientEvent.progress: self._handle_progress,
+            ClientEvent.upload: self._handle_upload,
+            ClientEvent.output: self._handle_output,
+            ClientEvent.finished: self._handle_finished,
+            ClientEvent.interrupted: self._handle_interrupted,
+            ClientEvent.error: self._handle_error,
+            ClientEvent.payment_required: self._handle_payment_required,
+        }
 
         self.jobs.selection_changed.connect(self.update_preview)
         connection.state_changed.connect(self._init_on_connect)
@@ -367,21 +383,21 @@ class DocumentModel(QObject, ObservableProperties):
 
     async def _enqueue_job(self, job: Job, input: WorkflowInput, front: bool = False):
         if not self.jobs.any_executing():
-            self.progress = 0.0
+            self._set_progress(0.0)
         client = self._connection.client
         job.id = await client.enqueue(input, front)
 
     def _prepare_upscale_image(self, dryrun=False):
         client = self._connection.client
         extent = self._doc.extent
-        image = self._doc.get_image(Bounds(0, 0, *extent)) if not dryrun else DummyImage(extent)
+        bounds = Bounds(0, 0, *extent)
+        image = self._doc.get_image(bounds) if not dryrun else DummyImage(extent)
         params = self.upscale.params
         params.upscale.model = params.upscale.model or client.models.default_upscaler
         if params.upscale.model not in client.models.upscalers:
             msg = _("The upscale model used by the document is not available on the server")
             self.report_error(Error(ErrorKind.warning, msg + f": {params.upscale.model}"))
             self.upscale.upscaler = params.upscale.model = client.models.default_upscaler
-        bounds = Bounds(0, 0, *self._doc.extent)
         sys_prompt = "4k uhd"
         if self.arch.is_edit:
             sys_prompt = "Enhance image quality. Preserve original content."
@@ -464,14 +480,14 @@ class DocumentModel(QObject, ObservableProperties):
         regions = self.active_regions
         region_layer = None
         job_regions: list[JobRegion] = []
-        inpaint = InpaintParams(InpaintMode.fill, Bounds(0, 0, *extent))
+        bounds = Bounds(0, 0, *extent)
+        inpaint = InpaintParams(InpaintMode.fill, bounds)
 
         image = None
         smod = get_selection_modifiers(self.arch, inpaint.mode, strength, min_mask_size)
         mask, selection_bounds = self._doc.create_mask_from_selection(smod)
         inpaint = calc_selection_pre_process(inpaint, selection_bounds, smod)
 
-        bounds = Bounds(0, 0, *self._doc.extent)
         region_layer = regions.get_active_region_layer(use_parent=False)
         if mask is None and region_layer.bounds != bounds:
             mask = get_region_inpaint_mask(region_layer, extent, min_size=min_mask_size)
@@ -597,9 +613,8 @@ class DocumentModel(QObject, ObservableProperties):
     def _get_current_image(self, bounds: Bounds, exclude_internal=True):
         exclude = []
         if exclude_internal:
-            exclude = [  # exclude control layers from projection
-                c.layer for c in self.regions.control if not c.mode.is_part_of_image
-            ]
+            if control := self.regions.control:  # exclude control layers from projection
+                exclude = [c.layer for c in control if not c.mode.is_part_of_image]
             if self._layer:  # exclude preview layer
                 exclude.append(self._layer)
 
@@ -640,6 +655,8 @@ class DocumentModel(QObject, ObservableProperties):
             self._connection.interrupt()
 
     def clear_queued(self):
+        if self.jobs.count(JobState.queued) == 0:
+            return []
         to_remove = [job for job in self.jobs if job.state is JobState.queued]
         for job in to_remove:
             self.jobs.remove(job)
@@ -662,40 +679,68 @@ class DocumentModel(QObject, ObservableProperties):
             util.client_logger.error(f"Received message {message} for unknown job.")
             return
 
-        if message.event is ClientEvent.queued:
-            self.jobs.notify_started(job)
-            self.progress = -1
-            self.progress_changed.emit(-1)
-        elif message.event is ClientEvent.progress:
-            self.jobs.notify_started(job)
-            self.progress_kind = ProgressKind.generation
-            self.progress = message.progress
-        elif message.event is ClientEvent.upload:
-            self.jobs.notify_started(job)
-            self.progress_kind = ProgressKind.upload
-            self.progress = message.progress
-        elif message.event is ClientEvent.output:
-            self.custom.handle_output(job, message.result)
-        elif message.event is ClientEvent.finished:
-            if message.error:  # successful jobs may have encountered some warnings
-                self.report_error(Error.from_string(message.error, ErrorKind.warning))
-            if message.images:
-                self.jobs.set_results(job, message.images)
-            if job.kind is JobKind.control_layer:
-                assert job.control is not None
-                job.control.layer_id = self.add_control_layer(job, message.result).id
-            elif job.kind is JobKind.upscaling:
-                self.add_upscale_layer(job)
-            self._finish_job(job, message.event)
-        elif message.event is ClientEvent.interrupted:
-            self._finish_job(job, message.event)
-        elif message.event is ClientEvent.error:
-            self._finish_job(job, message.event)
-            self.report_error(_("Server error") + f": {message.error}")
-        elif message.event is ClientEvent.payment_required:
-            self._finish_job(job, ClientEvent.error)
-            assert isinstance(message.error, str) and isinstance(message.result, dict)
-            self.report_error(Error(ErrorKind.insufficient_funds, message.error, message.result))
+        if handler := self._message_handlers.get(message.event):
+            handler(job, message)
+
+    def _handle_queued(self, job: Job, message: ClientMessage):
+        self.jobs.notify_started(job)
+        self._set_progress(-1)
+        self.progress_changed.emit(-1)
+
+    def _handle_progress(self, job: Job, message: ClientMessage):
+        self.jobs.notify_started(job)
+        self._report_progress(ProgressKind.generation, message.progress)
+
+    def _handle_upload(self, job: Job, message: ClientMessage):
+        self.jobs.notify_started(job)
+        self._report_progress(ProgressKind.upload, message.progress)
+
+    def _handle_output(self, job: Job, message: ClientMessage):
+        self.custom.handle_output(job, message.result)
+
+    def _handle_finished(self, job: Job, message: ClientMessage):
+        if message.error:  # successful jobs may have encountered some warnings
+            self.report_error(Error.from_string(message.error, ErrorKind.warning))
+        if message.images:
+            self.jobs.set_results(job, message.images)
+        if job.kind is JobKind.control_layer:
+            assert job.control is not None
+            job.control.layer_id = self.add_control_layer(job, message.result).id
+        elif job.kind is JobKind.upscaling:
+            self.add_upscale_layer(job)
+        self._finish_job(job, message.event)
+
+    def _handle_interrupted(self, job: Job, message: ClientMessage):
+        self._finish_job(job, message.event)
+
+    def _handle_error(self, job: Job, message: ClientMessage):
+        self._finish_job(job, message.event)
+        self.report_error(_("Server error") + f": {message.error}")
+
+    def _handle_payment_required(self, job: Job, message: ClientMessage):
+        self._finish_job(job, ClientEvent.error)
+        assert isinstance(message.error, str) and isinstance(message.result, dict)
+        self.report_error(Error(ErrorKind.insufficient_funds, message.error, message.result))
+
+    def _set_progress(self, value: float):
+        self._pending_progress = None
+        self.progress = value
+
+    def _report_progress(self, kind: ProgressKind, value: float):
+        # Frequent updates are throttled, the most recent value is applied when the timer expires.
+        # When the kind changes the value is applied immediately, so they are always consistent.
+        if kind is self.progress_kind and self._progress_timer.isActive():
+            self._pending_progress = value
+        else:
+            self.progress_kind = kind
+            self._set_progress(value)
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        if self._pending_progress is not None:
+            self.progress = self._pending_progress
+            self._pending_progress = None
+            self._progress_timer.start()
 
     def _finish_job(self, job: Job, event: ClientEvent):
         if job.kind is JobKind.upscaling:
@@ -703,7 +748,7 @@ class DocumentModel(QObject, ObservableProperties):
 
         if event is ClientEvent.finished:
             self.jobs.notify_finished(job)
-            self.progress = 1
+            self._set_progress(1)
 
             if job.id and job.kind in [JobKind.diffusion, JobKind.animation]:
                 action = settings.generation_finished_action
@@ -713,7 +758,7 @@ class DocumentModel(QObject, ObservableProperties):
                     self.apply_generated_result(job.id, 0)
         else:
             self.jobs.notify_cancelled(job)
-            self.progress = 0
+            self._set_progress(0)
 
     def update_preview(self):
         if selection := self.jobs.selection:
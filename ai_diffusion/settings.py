@@ -392,6 +392,13 @@ class Settings(QObject):
         _("Main memory (RAM) used for the history of generated images"),
     )
 
+    history_max_jobs: int
+    _history_max_jobs = Setting(
+        _("Active History Jobs"),
+        1000,
+        _("Maximum number of jobs kept in the history of generated images"),
+    )
+
     history_storage: int
     _history_storage = Setting(
         _("Stored History Size"),
@@ -297,6 +297,12 @@ def test_bounds_expand():
     assert result == Bounds(1, 0, 6, 7)
 
 
+def test_bounds_relative_to():
+    bounds = Bounds(3, 4, 5, 6)
+    assert bounds.relative_to(Bounds(1, 1, 10, 10)) == Bounds(2, 3, 5, 6)
+    assert bounds.relative_to(Bounds(0, 0, 10, 10)) is bounds
+
+
 def test_mask_to_image():
     data = QByteArray(b"\x00\x01\x02\xff")
     mask = Mask(Bounds(0, 0, 2, 2), data)
@@ -21,9 +21,9 @@ from ai_diffusion.image import BlendMode, Bounds, Extent, Image, ImageCollection
 from ai_diffusion.layer import Layer, LayerType
 from ai_diffusion.model.connection import Connection, ConnectionState
 from ai_diffusion.model.custom_workflow import WorkflowCollection
-from ai_diffusion.model.jobs import Job, JobKind, JobParams, JobRegion, JobState
+from ai_diffusion.model.jobs import Job, JobKind, JobParams, JobQueue, JobRegion, JobState
 from ai_diffusion.model.model import DocumentModel, ErrorKind, ProgressKind, no_error
-from ai_diffusion.settings import ApplyBehavior, ApplyRegionBehavior
+from ai_diffusion.settings import ApplyBehavior, ApplyRegionBehavior, settings
 from ai_diffusion.style import Style
 
 from .conftest import qtapp
@@ -355,6 +355,53 @@ async def test_job_queued_upload_progress_interrupted(workflows_dir: Path):
         assert model.progress == pytest.approx(0.0)
 
 
+@qtapp
+async def test_job_progress_throttled(workflows_dir: Path):
+    """Progress updates arriving in quick succession are coalesced, the latest value wins."""
+    krita_doc = Krita.instance().openDocument("test")
+    async with _model_env(krita_doc, workflows_dir) as (model, client):
+        job = await _run_generate(model, client)
+        assert job.id is not None
+
+        client.push(ClientMessage(ClientEvent.queued, job.id))
+        await _wait_for_job_state(job, JobState.executing)
+
+        client.push(ClientMessage(ClientEvent.progress, job.id, progress=0.2))
+        client.push(ClientMessage(ClientEvent.progress, job.id, progress=0.4))
+        client.push(ClientMessage(ClientEvent.progress, job.id, progress=0.6))
+        await asyncio.sleep(0)
+        assert model.progress == pytest.approx(0.2)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if model.progress == pytest.approx(0.6):
+                break
+        assert model.progress == pytest.approx(0.6)
+
+        # Switching between upload and generation applies the value without delay
+        client.push(ClientMessage(ClientEvent.progress, job.id, progress=0.7))
+        client.push(ClientMessage(ClientEvent.upload, job.id, progress=0.3))
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if model.progress_kind is ProgressKind.upload:
+                break
+        assert model.progress_kind is ProgressKind.upload
+        assert model.progress == pytest.approx(0.3)
+
+        client.push(ClientMessage(ClientEvent.progress, job.id, progress=0.8))
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if model.progress_kind is ProgressKind.generation:
+                break
+        assert model.progress_kind is ProgressKind.generation
+        assert model.progress == pytest.approx(0.8)
+
+        result_images = ImageCollection([Image.create(Extent(512, 512))])
+        client.push(ClientMessage(ClientEvent.finished, job.id, images=result_images))
+        await _wait_for_job_state(job, JobState.finished)
+        assert model.progress == pytest.approx(1.0)
+
+
 @qtapp
 async def test_job_payment_required(workflows_dir: Path):
     """Payment required response marks the job as cancelled and sets an insufficient-funds error."""
@@ -742,3 +789,95 @@ async def test_apply_region_group(workflows_dir: Path):
         assert isinstance(r2_right, tuple) and r2_right[3] == 0, (
             "result2: right side must be transparent"
         )
+
+
+# ---------------------------------------------------------------------------
+# Job queue
+# ---------------------------------------------------------------------------
+
+
+def test_job_queue_find():
+    jobs = JobQueue()
+    job = jobs.add(JobKind.diffusion, JobParams(Bounds(0, 0, 1, 1), "test"))
+    assert jobs.find("job1") is None
+
+    job.id = "job1"
+    assert jobs.find("job1") is job
+
+    job.id = "job2"
+    assert jobs.find("job1") is None
+    assert jobs.find("job2") is job
+
+    jobs.remove(job)
+    assert jobs.find("job2") is None
+
+
+def test_job_queue_count():
+    jobs = JobQueue()
+    job1 = jobs.add(JobKind.diffusion, JobParams(Bounds(0, 0, 1, 1), "test"))
+    job2 = jobs.add(JobKind.diffusion, JobParams(Bounds(0, 0, 1, 1), "test"))
+    assert jobs.count(JobState.queued) == 2
+    assert not jobs.any_executing()
+
+    jobs.notify_started(job1)
+    assert jobs.count(JobState.queued) == 1
+    assert jobs.any_executing()
+
+    job1.state = JobState.finished
+    assert jobs.count(JobState.finished) == 1
+    assert not jobs.any_executing()
+
+    jobs.remove(job2)
+    assert jobs.count(JobState.queued) == 0
+
+
+def test_job_queue_memory_usage():
+    jobs = JobQueue()
+    job = jobs.add(JobKind.diffusion, JobParams(Bounds(0, 0, 1, 1), "test"))
+    job.id = "job1"
+    images = [Image.create(Extent(512, 512)) for _ in range(2)]
+    jobs.set_results(job, ImageCollection(images))
+    assert jobs.memory_usage == pytest.approx(2.0)
+
+    jobs.discard("job1", 1)
+    assert jobs.memory_usage == pytest.approx(1.0)
+
+    jobs.discard("job1", 0)
+    assert jobs.memory_usage == pytest.approx(0.0)
+    assert jobs.find("job1") is None
+
+
+def test_job_queue_max_jobs():
+    def add(jobs: JobQueue, id: str):
+        return jobs.add_job(Job(id, JobKind.diffusion, JobParams(Bounds(0, 0, 1, 1), "test")))
+
+    max_jobs = settings.history_max_jobs
+    settings.history_max_jobs = 2
+    try:
+        jobs = JobQueue()
+        discarded = []
+        jobs.job_discarded.connect(discarded.append)
+
+        first = add(jobs, "job1")
+        first.state = JobState.finished
+        second = add(jobs, "job2")
+        third = add(jobs, "job3")
+        assert len(jobs) == 2
+        assert discarded == [first]
+        assert jobs.find("job1") is None
+
+        # Unfinished job at the head is kept, the queue grows beyond the limit
+        add(jobs, "job4")
+        assert len(jobs) == 3
+        assert discarded == [first]
+        assert jobs.find("job2") is second
+        assert jobs.count(JobState.queued) == 3
+
+        # The oldest finished job is discarded, even if it is not at the head
+        third.state = JobState.finished
+        add(jobs, "job5")
+        assert len(jobs) == 3
+        assert discarded == [first, third]
+        assert jobs.find("job2") is second
+    finally:
+        settings.history_max_jobs = max_jobs